@@ -0,0 +1,35 @@
+"""add birthday mmdd index
+
+Revision ID: 7c41aa80b2f1
+Revises: d518a89babb6
+Create Date: 2026-08-27 10:24:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41aa80b2f1'
+down_revision: Union[str, Sequence[str], None] = 'd518a89babb6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_contacts_user_bday_mmdd',
+        'contacts',
+        [
+            'user_id',
+            sa.text('(EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday))'),
+        ],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_bday_mmdd', table_name='contacts')
@@ -0,0 +1,28 @@
+"""add contacts listing index
+
+Revision ID: e59c10db43a7
+Revises: 7c41aa80b2f1
+Create Date: 2026-08-27 11:02:11.473920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e59c10db43a7'
+down_revision: Union[str, Sequence[str], None] = '7c41aa80b2f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contacts_user_id_id', 'contacts', ['user_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
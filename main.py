@@ -3,14 +3,39 @@ Main entry point for FastAPI application.
 Configures routers, CORS middleware, and server startup.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api import contacts, utils, auth, users
+from src.database.db import sessionmanager
 from src.events import user_cache
-
-# Create FastAPI app instance
-app = FastAPI()
+from src.services.email import MAIL_WORKERS, mail_worker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: pre-warm the database pool, start the mail queue
+    workers and the user-cache invalidation listener, stop them cleanly on
+    shutdown and dispose the database engine.
+    """
+    await sessionmanager.warm_up()
+    workers = [asyncio.create_task(mail_worker()) for _ in range(MAIL_WORKERS)]
+    workers.append(asyncio.create_task(user_cache.user_invalidation_listener()))
+    yield
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+    await sessionmanager.close()
+
+
+# Create FastAPI app instance; orjson serializes responses in C instead of
+# going through the stdlib json module.
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # Allowed origins for CORS
 origins = ["*"]
@@ -8,8 +8,6 @@ from fastapi import (
     HTTPException,
     Depends,
     status,
-    BackgroundTasks,
-    Request,
 )
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,14 +21,16 @@ from src.schemas.users import (
     RequestEmail,
     ResetPasswordRequest,
 )
+from src.conf.settings import settings
 from src.services.users import UserService
 from src.services.auth import (
     Hash,
+    hash_handler,
     create_token_pair,
     get_email_from_token,
     get_username_from_token_refresh,
 )
-from src.services.email import send_mail
+from src.services.email import enqueue_mail, send_mail
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
@@ -38,16 +38,12 @@ router = APIRouter(prefix="/auth", tags=["Auth"])
 @router.post("/sign_up/", response_model=User, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
-    background_tasks: BackgroundTasks,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """
     Register a new user and send a confirmation email.
     Args:
         user_data (UserCreate): Data for the new user.
-        background_tasks (BackgroundTasks): FastAPI background tasks manager.
-        request (Request): FastAPI request object.
         db (AsyncSession): SQLAlchemy async session.
     Returns:
         User: The created user object.
@@ -55,25 +51,24 @@ async def register_user(
         HTTPException: If username or email already exists.
     """
     user_service = UserService(db)
-    user = await user_service.get_user_by_username(user_data.username)
-    if user:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"User with username: {user_data.username} already exists",
-        )
-
-    if await user_service.get_user_by_email(user_data.email):
+    user_data.password = await hash_handler.get_password_hash(user_data.password)
+    try:
+        new_user = await user_service.create_user(user_data)
+    except ValueError:
+        conflict = await user_service.find_conflict(user_data.username, user_data.email)
+        if conflict == "username":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"User with username: {user_data.username} already exists",
+            )
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=f"User with email: {user_data.email} already exists",
         )
-
-    user_data.password = await Hash().get_password_hash(user_data.password)
-    new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-        send_mail, new_user.email, new_user.username, str(request.base_url)
-    )
-    return User.model_validate(new_user)
+    enqueue_mail(send_mail, new_user.email, new_user.username, settings.BASE_URL)
+    # response_model=User validates on the way out; validating here as well
+    # would run Pydantic twice per signup.
+    return new_user
 
 
 @router.post("/login/", response_model=Token)
@@ -92,7 +87,9 @@ async def login_user(
     """
     user_service = UserService(db)
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not await Hash().verify_password(form_data.password, user.password):
+    if not user or not await hash_handler.verify_password(
+        form_data.password, user.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect login or password",
@@ -104,6 +101,12 @@ async def login_user(
             detail="Email address not confirmed",
         )
 
+    if Hash.needs_rehash(user.password):
+        # Legacy bcrypt hash: upgrade to argon2id now that we have the
+        # plain password. Happens once per user.
+        new_hash = await hash_handler.get_password_hash(form_data.password)
+        await user_service.update_user_password(user, new_hash)
+
     return await create_token_pair(data={"sub": user.username})
 
 
@@ -137,30 +140,27 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)):
     """
     email = await get_email_from_token(token)
     user_service = UserService(db)
-    user = await user_service.get_user_by_email(email)
-    if user is None or email is None:
+    if await user_service.try_confirm_email(email):
+        return {"message": "Email success confirmed"}
+    # Miss: either the user does not exist or is already confirmed; one
+    # lightweight SELECT tells the cases apart.
+    state = await user_service.get_user_confirmation_state(email)
+    if state is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification error"
         )
-    if user.confirmed:
-        return {"message": "Your email already confirmed"}
-    await user_service.confirmed_email(email)
-    return {"message": "Email success confirmed"}
+    return {"message": "Your email already confirmed"}
 
 
 @router.post("/request_email/")
 async def request_email(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Request a confirmation email to be sent to the user.
     Args:
         body (RequestEmail): Email request data.
-        background_tasks (BackgroundTasks): FastAPI background tasks manager.
-        request (Request): FastAPI request object.
         db (AsyncSession): SQLAlchemy async session.
     Returns:
         dict: Message about email confirmation status.
@@ -168,37 +168,30 @@ async def request_email(
         HTTPException: If user not found.
     """
     user_service = UserService(db)
-    user = await user_service.get_user_by_email(body.email)
+    state = await user_service.get_user_confirmation_state(body.email)
 
-    if user is None:
+    if state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User with this email not found, please check entered email.",
         )
 
-    if user.confirmed:
+    if state.confirmed:
         return {"message": "Your email already confirmed"}
 
-    if user:
-        background_tasks.add_task(
-            send_mail, user.email, user.username, str(request.base_url)
-        )
+    enqueue_mail(send_mail, state.email, state.username, settings.BASE_URL)
     return {"message": "Check your email post"}
 
 
 @router.post("/request_reset_password/")
 async def request_reset_password(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
-    request: Request,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Request a password reset email to be sent to the user.
     Args:
         email (str): User's email address.
-        background_tasks (BackgroundTasks): FastAPI background tasks manager.
-        request (Request): FastAPI request object.
         db (AsyncSession): SQLAlchemy async session.
     Returns:
         dict: Message about password reset email status.
@@ -206,23 +199,23 @@ async def request_reset_password(
         HTTPException: If user not found.
     """
     user_service = UserService(db)
-    user = await user_service.get_user_by_email(body.email)
-    if user is None:
+    state = await user_service.get_user_confirmation_state(body.email)
+    if state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User with this email not found, please check entered email.",
         )
 
-    if not user.confirmed:
+    if not state.confirmed:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email address not confirmed",
         )
-    background_tasks.add_task(
+    enqueue_mail(
         send_mail,
-        user.email,
-        user.username,
-        str(request.base_url),
+        state.email,
+        state.username,
+        settings.BASE_URL,
         template="reset_password_email.html",
         subject="Reset your password",
     )
@@ -253,6 +246,6 @@ async def reset_password(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Verification error"
         )
-    hashed_new_password = await Hash().get_password_hash(body.new_password)
+    hashed_new_password = await hash_handler.get_password_hash(body.new_password)
     await user_service.update_user_password(user, hashed_new_password)
     return {"message": "password successfully saved"}
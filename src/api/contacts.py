@@ -3,10 +3,13 @@ Contacts API routes for CRUD operations and birthday queries.
 Uses FastAPI and SQLAlchemy async session.
 """
 
+import hashlib
+from datetime import date
 from typing import List
 
-from fastapi import APIRouter, HTTPException, Depends, status
-from pydantic import EmailStr
+from fastapi import APIRouter, HTTPException, Depends, Request, Response, status
+from pydantic import EmailStr, TypeAdapter
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
@@ -14,53 +17,78 @@ from src.database.models import User
 from src.schemas.contacts import ContactModel, ContactResponse
 from src.services.contacts import ContactService
 from src.services.auth import get_current_user
-from src.conf.settings import redis_cache
+from src.conf.settings import redis_client
 
 router = APIRouter(tags=["Contacts"], prefix="/contacts")
 
+# Compiled once at import; reused for every list response instead of letting
+# FastAPI re-walk the model tree through jsonable_encoder per request.
+_contacts_adapter = TypeAdapter(List[ContactResponse])
+_contact_adapter = TypeAdapter(ContactResponse)
+
+
+def _etag_response(request: Request, payload: bytes) -> Response:
+    """
+    Wrap a serialized payload with an ETag and honor If-None-Match.
+    The tag is a digest of the response bytes (contacts carry no updated_at
+    column to version on), so a matching client revalidation costs no body
+    transfer.
+    """
+    etag = f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(
+        content=payload, media_type="application/json", headers={"ETag": etag}
+    )
+
 
-@redis_cache
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
+    request: Request,
     first_name: str | None = None,
     last_name: str | None = None,
     email: EmailStr | None = None,
     phone_number: str | None = None,
     skip: int = 0,
     limit: int = 100,
+    after_id: int | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     Retrieve a list of contacts for the current user with optional filters and pagination.
     Args:
+        request (Request): Incoming request; read for If-None-Match.
         first_name (str, optional): Filter by first name.
         last_name (str, optional): Filter by last name.
         email (EmailStr, optional): Filter by email.
         phone_number (str, optional): Filter by phone number.
-        skip (int): Number of records to skip.
+        skip (int): Number of records to skip; ignored when after_id is given.
         limit (int): Maximum number of records to return.
+        after_id (int, optional): Keyset cursor — the id of the last contact
+            from the previous page. Seeks directly instead of scanning and
+            discarding skipped rows.
         db (AsyncSession): SQLAlchemy async session.
         user (User): Current authenticated user.
     Returns:
-        List[ContactResponse]: List of contacts.
+        List[ContactResponse]: List of contacts ordered by id.
     """
     contact_service = ContactService(db)
-    params = {}
-    if first_name:
-        params["first_name"] = first_name
-    if last_name:
-        params["last_name"] = last_name
-    if email:
-        params["email"] = email
-    if phone_number:
-        params["phone_number"] = phone_number
-    contacts = await contact_service.get_contacts(skip, limit, params, user)
-    return contacts
+    params = {
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": email,
+        "phone_number": phone_number,
+    }
+    contacts = await contact_service.get_contacts(
+        skip, limit, params, user, after_id=after_id
+    )
+    return _etag_response(request, _contacts_adapter.dump_json(contacts))
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def read_contact(
+    request: Request,
     contact_id: int,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
@@ -68,6 +96,7 @@ async def read_contact(
     """
     Retrieve a contact by its ID for the current user.
     Args:
+        request (Request): Incoming request; read for If-None-Match.
         contact_id (int): The contact's ID.
         db (AsyncSession): SQLAlchemy async session.
         user (User): Current authenticated user.
@@ -82,7 +111,7 @@ async def read_contact(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contact not found"
         )
-    return contact
+    return _etag_response(request, _contact_adapter.dump_json(contact))
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
@@ -170,5 +199,19 @@ async def coming_birthday_contacts(
     Returns:
         List[ContactResponse]: List of contacts with upcoming birthdays.
     """
+    cache_key = f"bdays:{user.id}:{date.today()}"
+    try:
+        cached = await redis_client.get(cache_key)
+    except RedisError:
+        cached = None
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     contact_service = ContactService(db)
-    return await contact_service.get_contacts_with_upcoming_birthdays(user)
+    contacts = await contact_service.get_contacts_with_upcoming_birthdays(user)
+    payload = _contacts_adapter.dump_json(contacts)
+    try:
+        await redis_client.set(cache_key, payload, ex=3600)
+    except RedisError:
+        pass
+    return Response(content=payload, media_type="application/json")
@@ -3,19 +3,33 @@ Utils API routes for health checking and diagnostics.
 Uses FastAPI and SQLAlchemy async session.
 """
 
+import logging
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from src.database.db import get_db
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(tags=["utils"])
 
+# Liveness/readiness probes hit this endpoint every few seconds per replica;
+# caching the healthy result for a second collapses a probe storm into at
+# most one SELECT per second per worker.
+_CACHE_SEC = 1.0
+_last_ok_ts = 0.0
+_OK_RESPONSE = {"message": "Welcome to FastAPI!!!!!!"}
+
 
 @router.get("/healthchecker/")
 async def healthchecker(db: AsyncSession = Depends(get_db)):
     """
     Health check endpoint to verify database connectivity.
+    A healthy result is cached briefly so probe storms do not hammer the
+    database.
     Args:
         db (AsyncSession): SQLAlchemy async session.
     Returns:
@@ -23,8 +37,10 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: If database is not configured or connection fails.
     """
+    global _last_ok_ts
+    if time.monotonic() - _last_ok_ts < _CACHE_SEC:
+        return _OK_RESPONSE
     try:
-        # Виконуємо асинхронний запит
         result = await db.execute(text("SELECT 1"))
         result = result.scalar_one_or_none()
 
@@ -33,9 +49,10 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database is not configured correctly",
             )
-        return {"message": "Welcome to FastAPI!!!!!!"}
+        _last_ok_ts = time.monotonic()
+        return _OK_RESPONSE
     except Exception as e:
-        print(e)
+        logger.exception("healthcheck failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Error connecting to the database",
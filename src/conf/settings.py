@@ -7,8 +7,7 @@ Loads environment variables from .env file and provides default values for local
 from pydantic import EmailStr, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from redis import Redis
-from redis_lru import RedisLRU
+from redis.asyncio import Redis
 
 
 class Settings(BaseSettings):
@@ -17,6 +16,7 @@ class Settings(BaseSettings):
     """
 
     DB_URL: str = "sqlite+aiosqlite:///./test.db"
+    BASE_URL: str = "http://localhost:8000/"
     JWT_SECRET: str = "your_jwt_secret"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXP_MIN: int = 60
@@ -36,6 +36,8 @@ class Settings(BaseSettings):
     CLD_NAME: str = "your_cloud_name"
     CLD_API_KEY: int = 123456789
     CLD_API_SECRET: str = "your_cloud_api_secret"
+    # Ask Cloudinary to invalidate CDN edge copies after an avatar replace.
+    CDN_PURGE: bool = False
 
     REDIS_HOST: str = "redis"
     REDIS_PORT: int = 6379
@@ -45,11 +47,20 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         extra="ignore",
         case_sensitive=True,
+        # Settings are read-only after startup; freezing skips Pydantic's
+        # assignment bookkeeping and makes accidental mutation loud.
+        frozen=True,
     )
 
 
 settings = Settings()
 
 
-redis_client = Redis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, password=None)
-redis_cache = RedisLRU(redis_client)
+# Async client shared by the user cache, birthday cache and invalidation
+# listeners; a Redis round trip never blocks the event loop.
+redis_client = Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    password=None,
+    max_connections=64,
+)
@@ -3,17 +3,23 @@ Database session management for SQLAlchemy async engine.
 Provides context manager and dependency for FastAPI.
 """
 
+import asyncio
 import contextlib
+import logging
 
+from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.conf.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseSessionManager:
     """
@@ -27,11 +33,59 @@ class DatabaseSessionManager:
         Args:
             url (str): Database connection URL.
         """
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        engine_kwargs = {}
+        if url.startswith("postgresql"):
+            # asyncpg keeps repeated repository queries as server-side
+            # prepared statements; jit off avoids Postgres JIT warm-up cost
+            # on the short OLTP queries this app issues.
+            engine_kwargs["connect_args"] = {
+                "prepared_statement_cache_size": 512,
+                "server_settings": {"jit": "off"},
+            }
+        # Pinned explicitly so a driver or URL change can never silently
+        # fall back to NullPool and reconnect per request.
+        self._engine: AsyncEngine | None = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=10,
+            max_overflow=20,
+            pool_timeout=30,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            **engine_kwargs,
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+            bind=self._engine,
         )
 
+    async def warm_up(self) -> None:
+        """
+        Open one connection per pool slot concurrently and return them all.
+        Called from the application lifespan so the first requests after a
+        deploy do not each pay the TLS and auth handshake; failure here is
+        logged but never blocks startup.
+        """
+        async def ping() -> None:
+            async with self.session() as session:
+                await session.execute(text("SELECT 1"))
+
+        try:
+            await asyncio.gather(*(ping() for _ in range(self._engine.pool.size())))
+        except SQLAlchemyError:
+            logger.warning("database pool warm-up failed", exc_info=True)
+
+    async def close(self) -> None:
+        """
+        Dispose the engine and return its pooled connections.
+        Called from the application lifespan on shutdown.
+        """
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
     @contextlib.asynccontextmanager
     async def session(self):
         """
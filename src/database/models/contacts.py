@@ -13,6 +13,9 @@ from src.database.models import Base
 
 import re
 
+# Compiled once at import; the validator runs on every contact write.
+_PHONE_RE = re.compile(r"^\+?\d{10,15}$")
+
 
 class Contact(Base):
     """
@@ -38,7 +41,9 @@ class Contact(Base):
     )
 
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
-    user = relationship("User", back_populates="contacts")
+    # No code path reads contact.user; lazy="raise" turns any accidental
+    # per-row lazy load into an error instead of a silent extra query.
+    user = relationship("User", back_populates="contacts", lazy="raise")
 
     @validates("email")
     def validate_email_with_library(self, key, address):
@@ -53,7 +58,9 @@ class Contact(Base):
             ValueError: If email is not valid.
         """
         try:
-            validate_email(address)
+            # Syntax-only validation: the default DNS deliverability lookup
+            # blocks the event loop thread on network I/O for every write.
+            validate_email(address, check_deliverability=False)
         except EmailNotValidError as e:
             raise ValueError(f"Invalid email: {e}")
         return address
@@ -70,18 +77,13 @@ class Contact(Base):
         Raises:
             ValueError: If phone number format is invalid.
         """
-        if not re.match(r"^\+?\d{10,15}$", value):
+        if not _PHONE_RE.match(value):
             raise ValueError("Invalid phone number format.")
         return value
 
     def __repr__(self):
         """
-        Return a string representation for debugging.
-        """
-        return f"<Contact(id={self.id}, name={self.first_name} {self.last_name}, email={self.email})>"
-
-    def __str__(self):
-        """
-        Return a human-readable string representation.
+        Return a short representation for debugging; kept to the primary key
+        so logging a contact never leaks names or email addresses.
         """
-        return f"Contact(id={self.id}, name={self.first_name} {self.last_name}, email={self.email})"
+        return f"<Contact id={self.id}>"
@@ -42,4 +42,6 @@ class User(Base):
     created_at: Mapped[int] = mapped_column(DateTime, default=func.now())
     roles: Mapped[Role] = mapped_column(Enum(Role, name="role_enum"), default=Role.user)
 
-    contacts = relationship("Contact", back_populates="user", cascade="all, delete")
+    contacts = relationship(
+        "Contact", back_populates="user", cascade="all, delete", lazy="raise"
+    )
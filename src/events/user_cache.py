@@ -1,13 +1,73 @@
+import asyncio
+
+from redis.exceptions import RedisError
 from sqlalchemy import event
+
 from src.database.models import User
 from src.conf.settings import redis_client
+from src.repository.users import evict_user
+
+# Channel other workers listen on to drop their process-local cache entries.
+USER_INVALIDATE_CHANNEL = "user:invalidate"
+
+# Strong references to in-flight invalidation tasks: the event loop only
+# keeps weak references, so without these a task could be garbage-collected
+# before its Redis delete/publish ran, leaving other workers stale.
+_pending_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> None:
+    """
+    Schedule a coroutine and keep a reference until it finishes.
+    Args:
+        coro: The coroutine to run as a task.
+    """
+    task = asyncio.get_running_loop().create_task(coro)
+    _pending_tasks.add(task)
+    task.add_done_callback(_pending_tasks.discard)
+
+
+def invalidate_user_cache(username: str) -> None:
+    """
+    Fire async cache invalidation from a sync mapper-event context.
+    The listeners run inside the event loop thread (async SQLAlchemy drives
+    them via greenlets), so the Redis delete and the cross-worker publish are
+    scheduled as tasks instead of blocking the loop; the local eviction is
+    immediate.
+    """
+    evict_user(username)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _spawn(redis_client.delete(f"username:{username}"))
+    _spawn(redis_client.publish(USER_INVALIDATE_CHANNEL, username))
+
+
+async def user_invalidation_listener() -> None:
+    """
+    Evict local cache entries published by other workers.
+    Runs for the lifetime of the app (started from the lifespan handler) and
+    reconnects with a delay if Redis becomes unreachable.
+    """
+    while True:
+        try:
+            async with redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(USER_INVALIDATE_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message["data"]
+                    evict_user(data.decode() if isinstance(data, bytes) else data)
+        except RedisError:
+            await asyncio.sleep(5)
 
 
 @event.listens_for(User, "after_update")
 def clear_user_cache(mapper, connection, target: User):
-    redis_client.delete(f"username:{target.username}")
+    invalidate_user_cache(target.username)
 
 
 @event.listens_for(User, "after_delete")
 def clear_user_cache_on_delete(mapper, connection, target: User):
-    redis_client.delete(f"username:{target.username}")
+    invalidate_user_cache(target.username)
@@ -1,12 +1,63 @@
 from datetime import date, timedelta
 from typing import List
 
-from sqlalchemy import select, extract, and_
+from sqlalchemy import bindparam, select, extract, or_, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 from src.database.models import Contact, User
 from src.schemas.contacts import ContactModel
 
+# Columns clients may filter the contact list by.
+_FILTER_FIELDS = ("first_name", "last_name", "email", "phone_number")
+
+
+# Columns ContactResponse actually serializes; listing queries fetch only
+# these instead of the full row.
+_RESPONSE_COLUMNS = (
+    Contact.id,
+    Contact.first_name,
+    Contact.last_name,
+    Contact.email,
+    Contact.phone_number,
+    Contact.birthday,
+    Contact.description,
+    Contact.created_at,
+)
+
+
+def _build_contacts_stmt(keyset: bool = False):
+    """
+    Build the contact listing statement once at import.
+    Every filter is expressed as ``:param IS NULL OR column = :param`` so the
+    statement text is identical regardless of which filters are supplied and
+    the database can reuse one prepared plan. The keyset variant seeks past
+    ``:after_id`` instead of discarding ``:skip`` rows, so deep pages stay
+    O(page size) instead of O(offset).
+    """
+    stmt = (
+        select(Contact)
+        .options(load_only(*_RESPONSE_COLUMNS))
+        .where(Contact.user_id == bindparam("user_id"))
+    )
+    for field in _FILTER_FIELDS:
+        param = bindparam(field)
+        stmt = stmt.where(or_(param.is_(None), getattr(Contact, field) == param))
+    if keyset:
+        return (
+            stmt.where(Contact.id > bindparam("after_id"))
+            .order_by(Contact.id)
+            .limit(bindparam("limit"))
+        )
+    return (
+        stmt.order_by(Contact.id).limit(bindparam("limit")).offset(bindparam("skip"))
+    )
+
+
+_CONTACTS_STMT = _build_contacts_stmt()
+_CONTACTS_SEEK_STMT = _build_contacts_stmt(keyset=True)
+
 
 class ContactRepository:
     """
@@ -25,32 +76,43 @@ class ContactRepository:
         self.db = session
 
     async def get_contacts(
-        self, skip: int, limit: int, params: dict, user: User
+        self,
+        skip: int,
+        limit: int,
+        params: dict,
+        user: User,
+        after_id: int | None = None,
     ) -> List[Contact]:
         """
         Retrieve a list of contacts for a user with optional filters and pagination.
 
         Args:
         skip : int
-            Number of records to skip.
+            Number of records to skip (ignored when after_id is given).
         limit : int
             Maximum number of records to return.
         params : dict
             Filter parameters for contacts.
         user : User
             The user whose contacts to retrieve.
+        after_id : int, optional
+            Keyset cursor; return contacts with an id greater than this.
 
         Returns
         list of Contact
-            List of Contact objects.
+            List of Contact objects ordered by id.
         """
-        stmt = (
-            select(Contact)
-            .filter_by(**params, user_id=user.id)
-            .offset(skip)
-            .limit(limit)
-        )
-        contacts = await self.db.execute(stmt)
+        values = {field: params.get(field) for field in _FILTER_FIELDS}
+        if after_id is not None:
+            contacts = await self.db.execute(
+                _CONTACTS_SEEK_STMT,
+                {**values, "user_id": user.id, "limit": limit, "after_id": after_id},
+            )
+        else:
+            contacts = await self.db.execute(
+                _CONTACTS_STMT,
+                {**values, "user_id": user.id, "limit": limit, "skip": skip},
+            )
         return list(contacts.scalars().all())
 
     async def get_contact_by_id(self, contact_id: int, user: User) -> Contact | None:
@@ -67,7 +129,9 @@ class ContactRepository:
         Contact or None
             The Contact object or None if not found.
         """
-        stmt = select(Contact).filter_by(id=contact_id, user_id=user.id)
+        stmt = select(Contact).where(
+            Contact.id == contact_id, Contact.user_id == user.id
+        )
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
@@ -85,7 +149,10 @@ class ContactRepository:
         Contact or None
             The Contact object or None if not found.
         """
-        stmt = select(Contact).filter_by(**query, user_id=user.id)
+        conditions = [
+            getattr(Contact, field) == value for field, value in query.items()
+        ]
+        stmt = select(Contact).where(Contact.user_id == user.id, *conditions)
         contact = await self.db.execute(stmt)
         return contact.scalar_one_or_none()
 
@@ -103,13 +170,10 @@ class ContactRepository:
         bool
             True if duplicate exists, False otherwise.
         """
-        stmt = (
-            select(Contact)
-            .filter_by(user_id=user.id)
-            .where(
-                (Contact.email == body.email)
-                | (Contact.phone_number == body.phone_number)
-            )
+        stmt = select(Contact).where(
+            Contact.user_id == user.id,
+            (Contact.email == body.email)
+            | (Contact.phone_number == body.phone_number),
         )
         result = await self.db.execute(stmt)
         existing_contact = result.scalar_one_or_none()
@@ -133,13 +197,13 @@ class ContactRepository:
         ValueError
             If a duplicate contact exists.
         """
-        if await self.check_contact_duplicate(body, user):
-            raise ValueError("Contact with this email or phone number already exists.")
-
         contact = Contact(**body.model_dump(exclude_unset=True), user_id=user.id)
         self.db.add(contact)
-        await self.db.commit()
-        await self.db.refresh(contact)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError("Contact with this email or phone number already exists.")
         return contact
 
     async def remove_contact(self, contact_id: int, user: User) -> Contact | None:
@@ -173,13 +237,20 @@ class ContactRepository:
         Returns:
             Contact or None: The updated Contact object or None if not found.
         """
-        contact = await self.get_contact_by_id(contact_id, user)
-        if contact:
-            for key, value in body.model_dump(exclude_unset=True).items():
-                setattr(contact, key, value)
-            await self.db.commit()
-            await self.db.refresh(contact)
-
+        values = body.model_dump(exclude_unset=True)
+        if not values:
+            return await self.get_contact_by_id(contact_id, user)
+        # One UPDATE ... RETURNING instead of SELECT, mutate, COMMIT: a
+        # single round trip and no read-modify-write race.
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**values)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def get_contacts_with_upcoming_birthdays(self, user: User) -> List[Contact]:
@@ -193,18 +264,24 @@ class ContactRepository:
             List[Contact]: List of contacts with upcoming birthdays.
         """
         today = date.today()
-        future_date = today + timedelta(days=7)
+        end = today + timedelta(days=7)
+        # Compare month*100+day so a single expression covers the window and
+        # can be served by the matching functional index; the OR branch
+        # handles the year wrap (e.g. Dec 28 - Jan 4), which the old
+        # per-field comparison got wrong.
+        mmdd = extract("month", Contact.birthday) * 100 + extract(
+            "day", Contact.birthday
+        )
+        start_mmdd = today.month * 100 + today.day
+        end_mmdd = end.month * 100 + end.day
+        if start_mmdd <= end_mmdd:
+            window = mmdd.between(start_mmdd, end_mmdd)
+        else:
+            window = or_(mmdd >= start_mmdd, mmdd <= end_mmdd)
         stmt = (
             select(Contact)
-            .filter_by(user_id=user.id)
-            .filter(
-                and_(
-                    extract("month", Contact.birthday) >= today.month,
-                    extract("day", Contact.birthday) >= today.day,
-                    extract("month", Contact.birthday) <= future_date.month,
-                    extract("day", Contact.birthday) <= future_date.day,
-                )
-            )
+            .options(load_only(*_RESPONSE_COLUMNS))
+            .where(Contact.user_id == user.id, window)
         )
         contacts = await self.db.execute(stmt)
         return list(contacts.scalars().all())
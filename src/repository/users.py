@@ -1,8 +1,25 @@
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
-from src.schemas.users import UserCreate
+
+# Process-local cache for the hot username lookup every authenticated
+# request performs. Entries are evicted by the mapper events in
+# src.events.user_cache and, across workers, by the user:invalidate pub/sub
+# channel; the short TTL bounds staleness if both miss.
+_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=60)
+
+
+def evict_user(username: str) -> None:
+    """
+    Drop a user from the process-local cache.
+
+    Args:
+        username (str): The username to evict.
+    """
+    _user_cache.pop(username, None)
 
 
 class UserRepository:
@@ -47,9 +64,18 @@ class UserRepository:
         User or None
             The User object or None if not found.
         """
+        cached = _user_cache.get(username)
+        if cached is not None:
+            # Attach the cached row to this session without a reload so
+            # mutations made through it still flush and fire the
+            # invalidation events.
+            return await self.db.merge(cached, load=False)
         stmt = select(User).filter_by(username=username)
-        user = await self.db.execute(stmt)
-        return user.scalar_one_or_none()
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        if user is not None:
+            _user_cache[username] = user
+        return user
 
     async def get_user_by_email(self, email: str) -> User | None:
         """
@@ -65,38 +91,104 @@ class UserRepository:
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
-    async def create_user(self, body: UserCreate, avatar: str | None = None) -> User:
+    async def find_conflict(self, username: str, email: str) -> str | None:
+        """
+        Determine which unique field an existing user collides on.
+        One query replaces separate username and email lookups.
+
+        Args:
+            username (str): The username to check.
+            email (str): The email address to check.
+
+        Returns:
+            str or None: "username" or "email" for the first matching field,
+            None if neither is taken.
+        """
+        stmt = (
+            select(User.username, User.email)
+            .where(or_(User.username == username, User.email == email))
+            .limit(2)
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+        if any(row.username == username for row in rows):
+            return "username"
+        if rows:
+            return "email"
+        return None
+
+    async def get_user_confirmation_state(self, email: str):
+        """
+        Retrieve a lightweight confirmation-state row for a user.
+        Fetches only the columns the confirmation flows need instead of
+        hydrating the full User entity.
+
+        Args:
+            email (str): The user's email address.
+
+        Returns:
+            Row or None: (id, confirmed, username, email) or None if not found.
+        """
+        stmt = select(User.id, User.confirmed, User.username, User.email).filter_by(
+            email=email
+        )
+        result = await self.db.execute(stmt)
+        return result.one_or_none()
+
+    async def create_user(self, data: dict, avatar: str | None = None) -> User:
         """
         Create a new user in the database.
 
         Args:
-            body (UserCreate): Data for the new user.
+            data (dict): Field values for the new user, already dumped from
+                the validated schema.
             avatar (str, optional): URL or path to the user's avatar image.
 
         Returns:
             User: The created User object.
+
+        Raises:
+            ValueError: If the username or email is already taken.
         """
-        user = User(**body.model_dump(exclude_unset=True), avatar=avatar)
+        user = User(**data, avatar=avatar)
         self.db.add(user)
-        await self.db.commit()
-        await self.db.refresh(user)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            await self.db.rollback()
+            raise ValueError("User with this username or email already exists.")
         return user
 
-    async def confirmed_email(self, email: str) -> None:
+    async def confirmed_email(self, email: str) -> bool:
         """
-        Mark a user's email as confirmed.
+        Mark a user's email as confirmed with a single atomic UPDATE.
+        No row is hydrated; the WHERE clause skips already-confirmed users.
 
         Args:
             email (str): The user's email address.
 
         Returns:
-            None
-        None
-        """
-        user = await self.get_user_by_email(email)
-        if user is not None:
-            user.confirmed = True
-            await self.db.commit()
+            bool: True if a row was flipped to confirmed, False if the user
+            does not exist or was already confirmed.
+        """
+        stmt = (
+            update(User)
+            .where(User.email == email, User.confirmed.is_(False))
+            .values(confirmed=True)
+            .returning(User.username)
+        )
+        result = await self.db.execute(stmt)
+        await self.db.commit()
+        username = result.scalar_one_or_none()
+        if username is None:
+            return False
+        # Core UPDATE bypasses the mapper events, so invalidate explicitly —
+        # including Redis and the cross-worker channel, or other workers
+        # would keep rejecting the freshly confirmed user for the cache TTL.
+        from src.events.user_cache import invalidate_user_cache
+
+        invalidate_user_cache(username)
+        return True
 
     async def update_avatar_url(self, email: str, url: str) -> User | None:
         """
@@ -109,20 +201,33 @@ class UserRepository:
         Returns:
             User or None: The updated User object or None if user not found.
         """
-        user = await self.get_user_by_email(email)
+        stmt = (
+            update(User).where(User.email == email).values(avatar=url).returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        await self.db.commit()
         if user is not None:
-            user.avatar = url
-            await self.db.commit()
-            await self.db.refresh(user)
-            return user
-        return None
+            # Core UPDATE bypasses the mapper events, so invalidate the
+            # caches explicitly. Imported here to avoid the module cycle
+            # with the event listeners.
+            from src.events.user_cache import invalidate_user_cache
+
+            invalidate_user_cache(user.username)
+        return user
 
     async def update_user_password(self, user: User, new_password: str) -> None:
         """
-        Update the password for a user.
+        Update the password for a user with a single UPDATE statement.
         Args:
             user (User): The user whose password is to be updated.
-            new_password (str): The new password.
+            new_password (str): The new password hash.
         """
-        user.password = new_password
+        stmt = update(User).where(User.id == user.id).values(password=new_password)
+        await self.db.execute(stmt)
         await self.db.commit()
+        # Core UPDATE bypasses the mapper events; other workers must drop
+        # their cached row so logins verify against the new hash.
+        from src.events.user_cache import invalidate_user_cache
+
+        invalidate_user_cache(user.username)
@@ -3,8 +3,17 @@ Pydantic schemas for Contact entity.
 Defines models for contact creation and response.
 """
 
+import re
 from datetime import datetime, date
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from src.schemas.fields import EmailField
+
+# Same format the Contact ORM model enforces; validating here as well keeps
+# paths that write without hydrating the entity (UPDATE ... RETURNING) from
+# persisting malformed numbers.
+_PHONE_RE = re.compile(r"^\+?\d{10,15}$")
 
 
 class ContactModel(BaseModel):
@@ -21,11 +30,27 @@ class ContactModel(BaseModel):
 
     first_name: str = Field(max_length=50)
     last_name: str = Field(max_length=50)
-    email: EmailStr
+    email: EmailField
     phone_number: str = Field(max_length=15)
     birthday: date
     description: str = Field(max_length=150)
 
+    @field_validator("phone_number")
+    @classmethod
+    def validate_phone_number(cls, value: str) -> str:
+        """
+        Validate the phone number format.
+        Args:
+            value (str): Phone number to validate.
+        Returns:
+            str: Validated phone number.
+        Raises:
+            ValueError: If phone number format is invalid.
+        """
+        if not _PHONE_RE.match(value):
+            raise ValueError("Invalid phone number format.")
+        return value
+
 
 class ContactResponse(ContactModel):
     """
@@ -37,5 +62,7 @@ class ContactResponse(ContactModel):
     """
 
     id: int
-    model_config = ConfigDict(from_attributes=True)
+    # frozen lets pydantic-core skip the setattr plumbing for instances that
+    # are only ever built and serialized.
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
     created_at: datetime
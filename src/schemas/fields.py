@@ -0,0 +1,11 @@
+"""
+Shared field annotations reused across schema modules.
+Declaring one annotation object lets pydantic-core reuse the compiled
+validator (e.g. the email regex) instead of building one per field.
+"""
+
+from typing import Annotated
+
+from pydantic import EmailStr, Field
+
+EmailField = Annotated[EmailStr, Field()]
@@ -3,8 +3,10 @@ Pydantic schemas for User entity and authentication.
 Defines models for user creation, response, token, and email requests.
 """
 
-from pydantic import BaseModel, ConfigDict, EmailStr, SecretStr
+from pydantic import BaseModel, ConfigDict, SecretStr
+
 from src.database.models import Role
+from src.schemas.fields import EmailField
 
 
 class UserCreate(BaseModel):
@@ -16,7 +18,7 @@ class UserCreate(BaseModel):
         password (str): User's password.
     """
 
-    email: EmailStr
+    email: EmailField
     username: str
     password: str
 
@@ -32,11 +34,11 @@ class User(BaseModel):
     """
 
     id: int
-    email: EmailStr
+    email: EmailField
     username: str
     avatar: str
     roles: Role
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, extra="ignore", frozen=True)
 
 
 class Token(BaseModel):
@@ -50,6 +52,7 @@ class Token(BaseModel):
     access_token: str
     refresh_token: str
     token_type: str
+    model_config = ConfigDict(frozen=True)
 
 
 class TokenRefresh(BaseModel):
@@ -69,7 +72,7 @@ class RequestEmail(BaseModel):
         email (EmailStr): User's email address.
     """
 
-    email: EmailStr
+    email: EmailField
 
 
 class ResetPasswordRequest(BaseModel):
@@ -3,14 +3,25 @@ Authentication and authorization services for FastAPI application.
 Includes password hashing, JWT token creation, and user retrieval.
 """
 
-import pickle
+import asyncio
+import hashlib
+import logging
+import os
+import time
+
+import anyio
+import anyio.to_thread
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+import bcrypt
+import jwt
+import orjson
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from passlib.context import CryptContext
-from jose import jwt, JWTError
+from jwt import InvalidTokenError as JWTError
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from datetime import datetime, timedelta, UTC
 
 from src.conf.settings import settings
 from src.database.db import get_db
@@ -19,42 +30,168 @@ from src.schemas.users import User, Token
 from src.services.users import UserService
 from src.conf.settings import redis_client
 
+logger = logging.getLogger(__name__)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
+# Cache of decoded payloads keyed by a digest of the token. Repeat requests
+# with the same bearer token skip the HMAC check and JSON parse; the user row
+# itself is still resolved through the Redis cache below, so profile changes
+# propagate independently of this cache.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Dedicated capacity limiter for password KDF work. Keeping the KDF off
+# anyio's shared worker pool means a login burst can never starve the threads
+# Starlette uses for file and sync-dependency work, and waiters queue fairly
+# here instead of piling onto a pool queue. bcrypt and argon2-cffi release
+# the GIL in C, so cpu_count tokens saturate the cores.
+_kdf_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+
+# Decode arguments prepared once at import; settings itself is a module-level
+# singleton, so nothing re-reads the environment per request.
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+# PyJWT accepts bytes keys; encoding once here saves a UTF-8 encode of the
+# secret on every mint/verify.
+_JWT_SECRET = settings.JWT_SECRET.encode("utf-8")
+
+
+def _jwt_encode(payload: dict) -> str:
+    """
+    Mint a token through the JWS layer with the payload serialized by orjson,
+    which is considerably faster than the stdlib json encoder PyJWT uses.
+    Decoding stays on jwt.decode so exp/signature validation is unchanged.
+    """
+    return jwt.api_jws.encode(
+        orjson.dumps(payload), _JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+    )
+
+# Token lifetimes in whole seconds; JWT "exp"/"iat" are integer timestamps,
+# so minting works with time.time() and integer math instead of allocating
+# datetime/timedelta objects per token.
+_ACCESS_TD_SECONDS = settings.JWT_EXP_MIN * 60
+_REFRESH_TD_SECONDS = settings.JWT_REFRESH_EXP_DAYS * 86400
+_EMAIL_TD_SECONDS = 7 * 86400
+
 credential_exception = HTTPException(
     status_code=status.HTTP_401_UNAUTHORIZED,
     detail="Could not validate credentials",
     headers={"WWW-Authenticate": "Bearer"},
 )
 
+# FastAPI re-serializes an HTTPException on every raise, so the instances can
+# be shared; building them per call just allocated the same dicts repeatedly.
+invalid_token_type_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid token type",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+bad_email_token_exception = HTTPException(
+    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    detail="Uncorrect token for email check",
+)
+
+bad_refresh_token_exception = HTTPException(
+    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+    detail="Uncorrect token for username check",
+)
+
 
 class Hash:
     """
-    Utility class for password hashing and verification using bcrypt.
+    Utility class for password hashing and verification.
+    New passwords are hashed with argon2id; legacy bcrypt hashes are still
+    verified so existing users can keep logging in.
+
+    Note: never compare secrets (tokens, API keys, password digests) with
+    ``==`` — use ``hmac.compare_digest`` so the comparison is constant-time.
+    The KDF and JWT verifiers used here are constant-time already; the rule
+    applies to any future direct comparison, e.g. a refresh-token blacklist.
     """
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    argon2_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+    # Short-lived cache of verification results so repeated logins within a
+    # small window skip the KDF entirely. Keys are blake2b digests, so no
+    # plain passwords are kept in memory.
+    _verify_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+    def _verify_sync(self, plain_password: str, hashed_password: str) -> bool:
+        """
+        Run the actual KDF check, dispatching on the stored hash format.
+        Args:
+            plain_password (str): The plain text password.
+            hashed_password (str): The hashed password.
+        Returns:
+            bool: True if passwords match, False otherwise.
+        """
+        if hashed_password.startswith("$argon2"):
+            try:
+                return self.argon2_hasher.verify(hashed_password, plain_password)
+            except (VerificationError, InvalidHashError):
+                return False
+        # Legacy hashes go straight to the bcrypt C binding; the passlib
+        # wrapper added scheme lookup and deprecation checks per call.
+        try:
+            return bcrypt.checkpw(
+                plain_password.encode(), hashed_password.encode()
+            )
+        except ValueError:
+            return False
 
     async def verify_password(self, plain_password, hashed_password) -> bool:
         """
         Verify a plain password against a hashed password.
+        The KDF runs on a dedicated worker-thread budget so it neither blocks
+        the event loop nor starves the shared thread pool; results are cached
+        for a short TTL keyed by a digest of the pair.
         Args:
             plain_password (str): The plain text password.
             hashed_password (str): The hashed password.
         Returns:
             bool: True if passwords match, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        cache_key = hashlib.blake2b(
+            f"{hashed_password}:{plain_password}".encode(), digest_size=32
+        ).digest()
+        cached = self._verify_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        result = await anyio.to_thread.run_sync(
+            self._verify_sync, plain_password, hashed_password, limiter=_kdf_limiter
+        )
+        self._verify_cache[cache_key] = result
+        return result
+
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Check whether a stored hash predates the argon2id switch.
+        Args:
+            hashed_password (str): The stored password hash.
+        Returns:
+            bool: True if the hash is a legacy bcrypt hash.
+        """
+        return not hashed_password.startswith("$argon2")
 
     async def get_password_hash(self, password: str) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password using argon2id.
+        The KDF runs on the dedicated worker-thread budget so signup bursts
+        do not serialize on the event loop thread.
         Args:
             password (str): The plain text password.
         Returns:
             str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        return await anyio.to_thread.run_sync(
+            self.argon2_hasher.hash, password, limiter=_kdf_limiter
+        )
+
+
+# Shared instance; call sites should use this instead of instantiating Hash
+# per request.
+hash_handler = Hash()
 
 
 async def create_access_token(data: dict, expires_delta: int | None = None) -> str:
@@ -66,15 +203,11 @@ async def create_access_token(data: dict, expires_delta: int | None = None) -> s
     Returns:
         str: Encoded JWT token.
     """
-    to_encode = data.copy()
     if expires_delta is None:
-        expires_delta = settings.JWT_EXP_MIN
-    expire = datetime.now() + timedelta(minutes=expires_delta)
-    to_encode.update({"exp": expire, "type": "access"})
-    encode_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
-    return encode_jwt
+        expire = int(time.time()) + _ACCESS_TD_SECONDS
+    else:
+        expire = int(time.time()) + expires_delta * 60
+    return _jwt_encode({**data, "exp": expire, "type": "access"})
 
 
 async def create_refresh_token(data: dict) -> str:
@@ -85,18 +218,14 @@ async def create_refresh_token(data: dict) -> str:
     Returns:
         str: Encoded JWT refresh token.
     """
-    to_encode = data.copy()
-    expire = datetime.now() + timedelta(days=settings.JWT_REFRESH_EXP_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encode_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
-    return encode_jwt
+    expire = int(time.time()) + _REFRESH_TD_SECONDS
+    return _jwt_encode({**data, "exp": expire, "type": "refresh"})
 
 
 async def create_token_pair(data: dict) -> Token:
-    access_token = await create_access_token(data=data)
-    refresh_token = await create_refresh_token(data=data)
+    access_token, refresh_token = await asyncio.gather(
+        create_access_token(data=data), create_refresh_token(data=data)
+    )
     return Token(
         access_token=access_token, refresh_token=refresh_token, token_type="bearer"
     )
@@ -112,13 +241,16 @@ async def jwt_decode(token: str) -> dict:
     Raises:
         HTTPException: If the token is invalid or cannot be decoded.
     """
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _token_cache.get(cache_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
         return payload
+    try:
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
     except JWTError as e:
         raise credential_exception from e
+    _token_cache[cache_key] = payload
+    return payload
 
 
 async def get_current_user(
@@ -137,28 +269,32 @@ async def get_current_user(
 
     payload = await jwt_decode(token)
     if payload.get("type") != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise invalid_token_type_exception
     username = payload.get("sub")
     user_redis_key = f"username:{username}"
-    user = redis_client.get(user_redis_key)
+    cached = await redis_client.get(user_redis_key)
+    if cached is not None:
+        logger.debug("user cache hit: %s", username)
+        # Rust-core JSON validation; much cheaper than unpickling an ORM
+        # instance and re-walking its attributes.
+        return User.model_validate_json(cached)
+    user_service = UserService(db)
+    user = await user_service.get_user_by_username(username)
     if user is None:
-        user_service = UserService(db)
-        user = await user_service.get_user_by_username(username)
-        if user is None:
-            raise credential_exception
-        redis_client.set(user_redis_key, pickle.dumps(user), ex=60)
-    else:
-        user = pickle.loads(user)
-        print("redis")
-    return User.model_validate(user)
+        raise credential_exception
+    user_dto = User.model_validate(user)
+    # NX: when concurrent misses race for the same user, only the first
+    # writer pays the SET and the TTL is not endlessly refreshed; a Lua
+    # get-or-set script would save nothing over this single command.
+    await redis_client.set(user_redis_key, user_dto.model_dump_json(), ex=60, nx=True)
+    return user_dto
+
+
+_ADMIN_ROLES = frozenset({Role.admin})
 
 
 async def get_current_admin_user(current_user=Depends(get_current_user)) -> User:
-    if current_user.roles != Role.admin:
+    if current_user.roles not in _ADMIN_ROLES:
         raise HTTPException(status_code=403, detail="Forbidden operation")
     return current_user
 
@@ -171,11 +307,8 @@ async def create_email_token(data: dict) -> str:
     Returns:
         str: Encoded JWT token for email confirmation.
     """
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
-    return token
+    now = int(time.time())
+    return _jwt_encode({**data, "iat": now, "exp": now + _EMAIL_TD_SECONDS})
 
 
 async def get_email_from_token(token: str) -> str:
@@ -189,16 +322,11 @@ async def get_email_from_token(token: str) -> str:
         HTTPException: If token is invalid or cannot be processed.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=settings.JWT_ALGORITHM
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
         email = payload["sub"]
         return email
     except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Uncorrect token for email check",
-        )
+        raise bad_email_token_exception from e
 
 
 async def get_username_from_token_refresh(token: str) -> str:
@@ -212,19 +340,10 @@ async def get_username_from_token_refresh(token: str) -> str:
         HTTPException: If token is invalid or cannot be processed.
     """
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=settings.JWT_ALGORITHM
-        )
+        payload = jwt.decode(token, _JWT_SECRET, algorithms=_JWT_ALGORITHMS)
         username = payload["sub"]
         if payload.get("type") != "refresh":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+            raise invalid_token_type_exception
         return username
     except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="Uncorrect token for username check",
-        )
+        raise bad_refresh_token_exception from e
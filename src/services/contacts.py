@@ -3,14 +3,32 @@ Service layer for Contact entity operations.
 Handles business logic and error handling for contacts.
 """
 
+from datetime import date
+
 from fastapi import HTTPException, status
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.conf.settings import redis_client
 from src.repository.contacts import ContactRepository
 from src.schemas.contacts import ContactModel
 from src.database.models import User
 
 
+async def _invalidate_birthday_cache(user: User) -> None:
+    """
+    Drop the cached upcoming-birthdays response for a user.
+    Called after any contact write; a missing or unreachable Redis is not an
+    error, the next read simply recomputes.
+    Args:
+        user (User): The user whose cache entry to drop.
+    """
+    try:
+        await redis_client.delete(f"bdays:{user.id}:{date.today()}")
+    except RedisError:
+        pass
+
+
 class ContactService:
     """
     Service class for managing contacts.
@@ -37,33 +55,48 @@ class ContactService:
             HTTPException: If a duplicate contact exists.
         """
         try:
-            return await self.contact_repository.create_contact(body, user)
+            contact = await self.contact_repository.create_contact(body, user)
         except ValueError as e:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        await _invalidate_birthday_cache(user)
+        return contact
 
-    async def get_contacts(self, skip: int, limit: int, params: dict, user: User):
+    def get_contacts(
+        self,
+        skip: int,
+        limit: int,
+        params: dict,
+        user: User,
+        after_id: int | None = None,
+    ):
         """
         Retrieve a list of contacts for a user with optional filters and pagination.
         Args:
-            skip (int): Number of records to skip.
+            skip (int): Number of records to skip (ignored when after_id is given).
             limit (int): Maximum number of records to return.
             params (dict): Filter parameters for contacts.
             user (User): The user whose contacts to retrieve.
+            after_id (int, optional): Keyset cursor; contacts with id greater
+                than this are returned.
         Returns:
-            List[Contact]: List of Contact objects.
+            List[Contact]: Awaitable resolving to the list of Contact objects.
         """
-        return await self.contact_repository.get_contacts(skip, limit, params, user)
+        # Pure pass-through: returning the repository coroutine directly
+        # avoids an extra coroutine frame per request.
+        return self.contact_repository.get_contacts(
+            skip, limit, params, user, after_id=after_id
+        )
 
-    async def get_contact(self, contact_id: int, user: User):
+    def get_contact(self, contact_id: int, user: User):
         """
         Get a contact by its ID for a specific user.
         Args:
             contact_id (int): The contact's ID.
             user (User): The user who owns the contact.
         Returns:
-            Contact | None: The Contact object or None if not found.
+            Contact | None: Awaitable resolving to the Contact or None.
         """
-        return await self.contact_repository.get_contact_by_id(contact_id, user)
+        return self.contact_repository.get_contact_by_id(contact_id, user)
 
     async def update_contact(self, contact_id: int, body: ContactModel, user: User):
         """
@@ -75,7 +108,10 @@ class ContactService:
         Returns:
             Contact | None: The updated Contact object or None if not found.
         """
-        return await self.contact_repository.update_contact(contact_id, body, user)
+        contact = await self.contact_repository.update_contact(contact_id, body, user)
+        if contact is not None:
+            await _invalidate_birthday_cache(user)
+        return contact
 
     async def remove_contact(self, contact_id: int, user: User):
         """
@@ -86,14 +122,17 @@ class ContactService:
         Returns:
             Contact | None: The removed Contact object or None if not found.
         """
-        return await self.contact_repository.remove_contact(contact_id, user)
+        contact = await self.contact_repository.remove_contact(contact_id, user)
+        if contact is not None:
+            await _invalidate_birthday_cache(user)
+        return contact
 
-    async def get_contacts_with_upcoming_birthdays(self, user: User):
+    def get_contacts_with_upcoming_birthdays(self, user: User):
         """
         Get contacts with birthdays in the next 7 days for a user.
         Args:
             user (User): The user whose contacts to check.
         Returns:
-            List[Contact]: List of contacts with upcoming birthdays.
+            List[Contact]: Awaitable resolving to contacts with upcoming birthdays.
         """
-        return await self.contact_repository.get_contacts_with_upcoming_birthdays(user)
+        return self.contact_repository.get_contacts_with_upcoming_birthdays(user)
@@ -1,8 +1,11 @@
 """
 Email service for sending confirmation emails using FastAPI-Mail.
-Configures mail connection and provides async send_mail function.
+Configures mail connection and provides async send_mail function plus a
+bounded queue drained by worker tasks started from the app lifespan.
 """
 
+import asyncio
+import logging
 from pathlib import Path
 
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
@@ -12,6 +15,8 @@ from pydantic import EmailStr
 from src.services.auth import create_email_token
 from src.conf.settings import settings
 
+logger = logging.getLogger(__name__)
+
 conf = ConnectionConfig(
     MAIL_USERNAME=settings.MAIL_USERNAME,
     MAIL_PASSWORD=settings.MAIL_PASSWORD,
@@ -26,6 +31,50 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / "templates",
 )
 
+# Single FastMail instance shared by every send; the connection configuration
+# and template environment are built once instead of per email.
+fm = FastMail(conf)
+
+# Number of worker tasks draining the mail queue; bounds concurrent SMTP
+# connections.
+MAIL_WORKERS = 2
+
+# Bounded so an overload surfaces as a visible error instead of unbounded
+# memory growth.
+mail_queue: asyncio.Queue = asyncio.Queue(maxsize=10_000)
+
+
+def enqueue_mail(func, /, *args, **kwargs) -> None:
+    """
+    Queue an email coroutine function for the worker tasks.
+    A saturated queue drops the mail and logs instead of raising: callers
+    enqueue after their database write has committed, so failing the request
+    at that point would surface a 500 for work that already succeeded.
+    Args:
+        func: Async callable that sends the email (usually send_mail).
+        *args: Positional arguments for the callable.
+        **kwargs: Keyword arguments for the callable.
+    """
+    try:
+        mail_queue.put_nowait((func, args, kwargs))
+    except asyncio.QueueFull:
+        logger.error("mail queue full, dropping %s%r", func.__name__, args)
+
+
+async def mail_worker() -> None:
+    """
+    Consume the mail queue forever, sending one email at a time.
+    Started from the application lifespan; cancelled on shutdown.
+    """
+    while True:
+        func, args, kwargs = await mail_queue.get()
+        try:
+            await func(*args, **kwargs)
+        except Exception:
+            logger.exception("mail delivery failed")
+        finally:
+            mail_queue.task_done()
+
 
 async def send_mail(
     email: EmailStr,
@@ -57,7 +106,6 @@ async def send_mail(
             },
             subtype=MessageType.html,
         )
-        fm = FastMail(conf)
         await fm.send_message(message, template_name=template)
-    except ConnectionErrors as err:
-        print(err)
+    except ConnectionErrors:
+        logger.exception("mail connection failed")
@@ -18,7 +18,8 @@ class RoleAccess:
     """
 
     def __init__(self, allowed_roles: list[Role]):
-        self.allowed_roles = allowed_roles
+        # frozenset: O(1) membership and no accidental mutation after wiring.
+        self.allowed_roles = frozenset(allowed_roles)
 
     def __call__(
         self, request: Request, current_user: User = Depends(get_current_user)
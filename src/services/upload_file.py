@@ -3,9 +3,17 @@ Service for uploading files to Cloudinary.
 Provides configuration and upload functionality for user avatars.
 """
 
+import asyncio
+
 import cloudinary
 import cloudinary.uploader
 
+from src.conf.settings import settings
+
+# Strong references to in-flight CDN purge tasks; the loop itself only holds
+# weak ones, so an unreferenced task can be collected before it runs.
+_pending_purges: set[asyncio.Task] = set()
+
 
 class UploadFileService:
     """
@@ -32,9 +40,11 @@ class UploadFileService:
         )
 
     @staticmethod
-    def upload_file(file, username) -> str:
+    def _upload_sync(file, username) -> str:
         """
-        Upload a file to Cloudinary and return the image URL.
+        Blocking Cloudinary upload; runs on a worker thread.
+        The SDK is handed the underlying spooled temporary file, so the body
+        streams from disk instead of being read into memory first.
         Args:
             file: File object to upload (should have .file attribute).
             username (str): Username to use in public_id.
@@ -47,3 +57,32 @@ class UploadFileService:
             width=250, height=250, crop="fill", version=r.get("version")
         )
         return src_url
+
+    @staticmethod
+    async def upload_file(file, username) -> str:
+        """
+        Upload a file to Cloudinary and return the image URL.
+        The network write happens in a thread so a multi-MB avatar upload
+        never blocks the event loop.
+        Args:
+            file: File object to upload (should have .file attribute).
+            username (str): Username to use in public_id.
+        Returns:
+            str: URL of the uploaded image.
+        """
+        url = await asyncio.to_thread(UploadFileService._upload_sync, file, username)
+        if settings.CDN_PURGE:
+            # Fire and forget: edge invalidation must not add latency to the
+            # response. The returned URL is already version-stamped, so this
+            # only helps readers still holding the previous versioned URL.
+            task = asyncio.get_running_loop().create_task(
+                asyncio.to_thread(
+                    cloudinary.uploader.explicit,
+                    f"RestApp/{username}",
+                    type="upload",
+                    invalidate=True,
+                )
+            )
+            _pending_purges.add(task)
+            task.add_done_callback(_pending_purges.discard)
+        return url
@@ -3,14 +3,31 @@ Service layer for User entity operations.
 Handles business logic for user creation, retrieval, and avatar updates.
 """
 
+import functools
+import hashlib
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
 from src.repository.users import UserRepository
 from src.schemas.users import UserCreate
 from src.database.models import User
 
 
+@functools.lru_cache(maxsize=4096)
+def _gravatar_url(email: str) -> str:
+    """
+    Build the Gravatar URL for an email address.
+    Cached so retried signups and repeated resolutions of the same address
+    skip the normalization and hashing.
+    Args:
+        email (str): The email address to derive the avatar from.
+    Returns:
+        str: The Gravatar image URL.
+    """
+    digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+    return f"https://www.gravatar.com/avatar/{digest}?d=identicon"
+
+
 class UserService:
     """
     Service class for managing users.
@@ -27,19 +44,20 @@ class UserService:
 
     async def create_user(self, body: UserCreate) -> User | None:
         """
-        Create a new user and set avatar using Gravatar.
+        Create a new user with a locally derived Gravatar avatar URL.
         Args:
             body (UserCreate): Data for the new user.
         Returns:
             User: The created user object.
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-        return await self.user_repository.create_user(body, avatar)
+        # Gravatar URLs are just a hash of the normalized email; computing
+        # the URL locally avoids a blocking HTTP round trip to gravatar.com
+        # on every signup.
+        # One model_dump here; the repository works with the plain dict and
+        # never touches the schema instance again.
+        return await self.user_repository.create_user(
+            body.model_dump(exclude_unset=True), _gravatar_url(body.email)
+        )
 
     async def get_user_by_id(self, user_id: int) -> User | None:
         """
@@ -71,15 +89,37 @@ class UserService:
         """
         return await self.user_repository.get_user_by_email(email)
 
-    async def confirmed_email(self, email: str) -> None:
+    async def find_conflict(self, username: str, email: str) -> str | None:
+        """
+        Determine which unique field an existing user collides on.
+        Args:
+            username (str): The username to check.
+            email (str): The email address to check.
+        Returns:
+            str | None: "username", "email", or None if neither is taken.
+        """
+        return await self.user_repository.find_conflict(username, email)
+
+    async def get_user_confirmation_state(self, email: str):
+        """
+        Retrieve a lightweight confirmation-state row for a user.
+        Args:
+            email (str): The user's email address.
+        Returns:
+            Row or None: (id, confirmed, username, email) or None if not found.
+        """
+        return await self.user_repository.get_user_confirmation_state(email)
+
+    async def try_confirm_email(self, email: str) -> bool:
         """
-        Mark a user's email as confirmed.
+        Mark a user's email as confirmed in one atomic statement.
         Args:
             email (str): The user's email address.
         Returns:
-            None
+            bool: True if the email was just confirmed, False if the user
+            does not exist or was already confirmed.
         """
-        await self.user_repository.confirmed_email(email)
+        return await self.user_repository.confirmed_email(email)
 
     async def update_avatar_url(self, email: str, url: str) -> User | None:
         """
@@ -1,7 +1,9 @@
 import asyncio
+import os
+
 import pytest
 import pytest_asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
@@ -11,7 +13,12 @@ from src.database.models import Base, User, Role
 from src.database.db import get_db
 from src.services.auth import create_access_token, Hash
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Per-xdist-worker database file so `pytest -n <N> --dist loadfile` can run
+# the integration modules in parallel without sharing one sqlite file.
+# Tests within a module depend on each other, so distribute by file.
+_worker = os.environ.get("PYTEST_XDIST_WORKER")
+_db_file = f"./test_{_worker}.db" if _worker else "./test.db"
+SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{_db_file}"
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -75,9 +82,16 @@ async def get_token():
     return token
 
 
+@pytest.fixture(autouse=True)
+def _no_send_mail(monkeypatch):
+    # One shared mock instead of a per-test monkeypatch line; also makes it
+    # impossible for a forgotten patch to hit real SMTP.
+    monkeypatch.setattr("src.api.auth.send_mail", Mock())
+
+
 @pytest.fixture(autouse=True)
 def mock_redis():
-    with patch("src.services.auth.redis_client", new=MagicMock()) as mock_instance:
+    with patch("src.services.auth.redis_client", new=AsyncMock()) as mock_instance:
         mock_instance.get.return_value = None
         mock_instance.set.return_value = True
         mock_instance.delete.return_value = True
@@ -86,6 +100,6 @@ def mock_redis():
 
 @pytest.fixture(autouse=True)
 def mock_redis_events():
-    with patch("src.events.user_cache.redis_client", new=MagicMock()) as mock_instance:
+    with patch("src.events.user_cache.redis_client", new=AsyncMock()) as mock_instance:
         mock_instance.delete.return_value = True
         yield mock_instance
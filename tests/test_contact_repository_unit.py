@@ -1,6 +1,7 @@
 from unittest import result
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
@@ -89,7 +90,6 @@ async def test_create_contact(contact_repository, mock_session, user):
         birthday=date.today(),
         description="test_contact",
     )
-    contact_repository.check_contact_duplicate = AsyncMock(return_value=False)
     # Call method
     result = await contact_repository.create_contact(body=contact_data, user=user)
 
@@ -98,39 +98,59 @@ async def test_create_contact(contact_repository, mock_session, user):
     assert result.first_name == "test_first_name"
     mock_session.add.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_contact_duplicate(contact_repository, mock_session, user):
+    # Setup
+    contact_data = ContactModel(
+        first_name="test_first_name",
+        last_name="test_last_name",
+        email="test@gmail.com",
+        phone_number="380915057018",
+        birthday=date.today(),
+        description="test_contact",
+    )
+    mock_session.commit = AsyncMock(side_effect=IntegrityError("stmt", {}, Exception()))
+
+    # Call method
+    with pytest.raises(ValueError):
+        await contact_repository.create_contact(body=contact_data, user=user)
+
+    # Assertions
+    mock_session.rollback.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_update_contact(contact_repository, mock_session, user):
     # Setup
-    existing_contact = Contact(
+    updated_contact = Contact(
         id=200,
-        first_name="contact_to_update",
-        last_name="contact_to_update",
-        email="contact_to_update@gmail.com",
-        phone_number="380935052000",
+        first_name="updated_first_name",
+        last_name="updated_last_name",
+        email="updated_email@gmail.com",
+        phone_number="380935057077",
         birthday="1989-01-01",
         description="test_contact_to_update",
         user_id=user.id,
     )
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
+    mock_result.scalar_one_or_none.return_value = updated_contact
     mock_session.execute = AsyncMock(return_value=mock_result)
-    contact_repository.get_contact_by_id = AsyncMock(return_value=existing_contact)
 
     contact_data = ContactModel(
         first_name="updated_first_name",
         last_name="updated_last_name",
         email="updated_email@gmail.com",
         phone_number="380935057077",
-        birthday=existing_contact.birthday,
-        description=existing_contact.description,
+        birthday=updated_contact.birthday,
+        description=updated_contact.description,
     )
 
     # Call method
     result = await contact_repository.update_contact(
-        contact_id=existing_contact.id, body=contact_data, user=user
+        contact_id=updated_contact.id, body=contact_data, user=user
     )
 
     # Assertions
@@ -139,6 +159,8 @@ async def test_update_contact(contact_repository, mock_session, user):
     assert result.last_name == "updated_last_name"
     assert result.email == "updated_email@gmail.com"
     assert result.phone_number == "380935057077"
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
 
 
 @pytest.mark.asyncio
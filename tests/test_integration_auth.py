@@ -1,4 +1,3 @@
-from unittest.mock import Mock
 from unittest.mock import AsyncMock
 import pytest
 from sqlalchemy import select
@@ -13,9 +12,7 @@ user_data = {
 }
 
 
-def test_signup(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
+def test_signup(client):
     response = client.post("api/auth/sign_up/", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
@@ -25,9 +22,7 @@ def test_signup(client, monkeypatch):
     assert "avatar" in data
 
 
-def test_repeat_signup(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
+def test_repeat_signup(client):
     response = client.post("api/auth/sign_up/", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
@@ -102,10 +97,8 @@ def test_validation_error_login(client):
     assert "detail" in data
 
 
-def test_signup_email_already_exists(client, monkeypatch):
+def test_signup_email_already_exists(client):
     """Try to register with an email that already exists but a different username."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
     user_data2 = {
         "username": "agent008",
         "email": "agent007@gmail.com",  # same email as user_data
@@ -117,10 +110,8 @@ def test_signup_email_already_exists(client, monkeypatch):
     assert data["detail"] == f"User with email: {user_data2['email']} already exists"
 
 
-def test_signup_validation_error(client, monkeypatch):
+def test_signup_validation_error(client):
     """Try to register with missing required fields."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
     incomplete_data = {
         "username": "agent009",
         "email": "agent009@gmail.com",
@@ -140,10 +131,8 @@ def test_confirmed_email_invalid_token(client):
     assert data["detail"] == "Uncorrect token for email check"
 
 
-def test_request_email_not_found(client, monkeypatch):
+def test_request_email_not_found(client):
     """Try to request email confirmation for a non-existent email."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
     body = {"email": "notfound@gmail.com"}
     response = client.post("api/auth/request_email/", json=body)
     assert response.status_code == 404, response.text
@@ -160,10 +149,8 @@ def test_request_email_already_confirmed(client):
     assert data["message"] == "Your email already confirmed"
 
 
-def test_request_email_success(client, monkeypatch):
+def test_request_email_success(client):
     """Request email confirmation for an unconfirmed user."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
 
     # First, create an unconfirmed user
     unconfirmed_user = {
@@ -184,10 +171,8 @@ def test_request_email_success(client, monkeypatch):
     assert data["message"] == "Check your email post"
 
 
-def test_request_reset_password_not_found(client, monkeypatch):
+def test_request_reset_password_not_found(client):
     """Try to request password reset for a non-existent email."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
     body = {"email": "notfound@gmail.com"}
     response = client.post("api/auth/request_reset_password/", json=body)
     assert response.status_code == 404, response.text
@@ -197,10 +182,8 @@ def test_request_reset_password_not_found(client, monkeypatch):
     )
 
 
-def test_request_reset_password_success(client, monkeypatch):
+def test_request_reset_password_success(client):
     """Request password reset for an existing user."""
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_mail", mock_send_email)
     body = {"email": user_data["email"]}
     response = client.post("api/auth/request_reset_password/", json=body)
     assert response.status_code == 200, response.text
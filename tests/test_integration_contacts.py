@@ -36,6 +36,25 @@ def test_create_contact_invalid_email(client, get_token):
     assert any("email" in str(err["loc"]) for err in data["detail"])
 
 
+def test_create_contact_invalid_phone(client, get_token):
+    response = client.post(
+        "/api/contacts",
+        json={
+            "first_name": "test_first_name",
+            "last_name": "test_last_name",
+            "email": "phone_test_email@gmail.com",
+            "phone_number": "not-a-phone!",
+            "birthday": "1989-01-01",
+            "description": "test_contact",
+        },
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+
+    assert response.status_code == 422
+    data = response.json()
+    assert any("phone_number" in str(err["loc"]) for err in data["detail"])
+
+
 def test_create_contact_duplicate_email(client, get_token):
     # Create first contact
     response1 = client.post(
@@ -151,6 +170,24 @@ def test_update_contact_not_found(client, get_token):
     assert data["detail"] == "Contact not found"
 
 
+def test_update_contact_invalid_phone(client, get_token):
+    response = client.put(
+        "/api/contacts/1",
+        json={
+            "first_name": "new_test_first_name",
+            "last_name": "test_last_name",
+            "email": "test_email@gmail.com",
+            "phone_number": "not-a-phone!",
+            "birthday": "1989-01-01",
+            "description": "test_contact",
+        },
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 422
+    data = response.json()
+    assert any("phone_number" in str(err["loc"]) for err in data["detail"])
+
+
 def test_delete_contact(client, get_token):
     response = client.delete(
         "/api/contacts/1", headers={"Authorization": f"Bearer {get_token}"}
@@ -196,3 +233,51 @@ def test_get_contacts_with_upcoming_birthdays(client, get_token):
     assert response.status_code == 200
     data = response.json()
     assert any(contact["first_name"] == "birthday_first_name" for contact in data)
+
+
+def test_get_contacts_etag_revalidation(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("/api/contacts", headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers.get("ETag")
+    assert etag
+
+    # Same data, same tag; a matching If-None-Match skips the body.
+    revalidation = client.get(
+        "/api/contacts", headers={**headers, "If-None-Match": etag}
+    )
+    assert revalidation.status_code == 304, revalidation.text
+    assert revalidation.headers.get("ETag") == etag
+    assert revalidation.content == b""
+
+
+def test_get_contact_etag_revalidation(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    contacts = client.get("/api/contacts", headers=headers).json()
+    contact_id = contacts[0]["id"]
+
+    response = client.get(f"/api/contacts/{contact_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers.get("ETag")
+    assert etag
+
+    revalidation = client.get(
+        f"/api/contacts/{contact_id}", headers={**headers, "If-None-Match": etag}
+    )
+    assert revalidation.status_code == 304, revalidation.text
+    assert revalidation.content == b""
+
+
+def test_get_contacts_after_id(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    contacts = client.get("/api/contacts", headers=headers).json()
+    assert len(contacts) >= 2
+    ids = [contact["id"] for contact in contacts]
+    assert ids == sorted(ids)
+
+    # The keyset cursor returns exactly the contacts after the given id.
+    response = client.get(
+        "/api/contacts", params={"after_id": ids[0]}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert [contact["id"] for contact in response.json()] == ids[1:]
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from tests.conftest import test_user
 
@@ -21,7 +21,18 @@ def test_get_me_without_token(client):
     assert data == {"detail": "Not authenticated"}
 
 
-@patch("src.services.upload_file.UploadFileService.upload_file")
+@patch("src.services.ratelimit.consume", new_callable=AsyncMock)
+def test_get_me_rate_limited(mock_consume, client, get_token):
+    # Without Redis the bucket fails open, so force an empty bucket to
+    # exercise the 429 branch of the dependency.
+    mock_consume.return_value = False
+    headers = {"Authorization": f"Bearer {get_token}"}
+    response = client.get("api/users/me", headers=headers)
+    assert response.status_code == 429, response.text
+    assert response.json() == {"detail": "Too many requests"}
+
+
+@patch("src.services.upload_file.UploadFileService.upload_file", new_callable=AsyncMock)
 def test_update_avatar_user(mock_upload_file, client, get_token):
     # Мокаємо відповідь від сервісу завантаження файлів
     fake_url = "<http://example.com/avatar.jpg>"